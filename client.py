@@ -1,18 +1,283 @@
 import asyncio
-import json
+import hashlib
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
 from typing import Optional
+
+import numpy as np
+import orjson
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
 
 # For Ollama integration
 import ollama
 
+# Ollama's plain mistral:7b tag is already a 4-bit (Q4_0) build, so this is
+# not an FP16 -> 4-bit speedup: q4_K_M is a slightly larger 4-bit build
+# that trades a little size for better output quality at similar speed.
+# Routing shares the answer model by default; a separate ROUTER_MODEL
+# (e.g. a q3_K_S build) needs room for both in memory, or Ollama swaps
+# them on every fallback
+CHAT_MODEL = os.environ.get("CHAT_MODEL", "mistral:7b-instruct-v0.3-q4_K_M")
+ROUTER_MODEL = os.environ.get("ROUTER_MODEL", CHAT_MODEL)
+
+# How long Ollama keeps the model (and the cached system prompts) resident
+OLLAMA_KEEP_ALIVE = "30m"
+# Re-load ping interval, a little under OLLAMA_KEEP_ALIVE
+KEEPALIVE_INTERVAL = 25 * 60
+
+# Static prompt prefixes. They are sent as system messages so the variable
+# user turn is the only part Ollama has to prefill on repeat calls.
+DECISION_SYSTEM_PROMPT = """You are a precise tool selector. Your task is to analyze the user's question and choose the most appropriate tool from the list below.
+
+# Available Tools & Formats:
+1.  **get_latest_news**: Use for general inquiries about news, events, festivals, workshops, or what's happening.
+    - Format: {"tool": "get_latest_news", "arguments": {}}
+
+2.  **get_college_notifications**: Use for official notices, circulars, announcements, and deadlines.
+    - Format: {"tool": "get_college_notifications", "arguments": {}}
+
+3.  **query_knowledge_base**: Use to search for specific information like syllabus, student details, or specific people.
+    - Format: {"tool": "query_knowledge_base", "arguments": {"query_text": "the user's search query"}}
+
+4.  **none**: Use for greetings, thank yous, or conversational chat.
+    - Format: {"tool": "none"}
+
+# Instructions:
+-   Analyze the user's question carefully.
+-   Choose the single best tool that matches the user's intent.
+-   **Respond with ONLY the JSON object in the exact format specified for the chosen tool.**"""
+
+PERSONA_SYSTEM_PROMPT = """You are BMSCE Assistant, a warm, friendly helper for BMS College of Engineering students, like a helpful senior.
+Each message has a student's question (Q) and data you retrieved (DATA). Answer from the data concisely and naturally, as if you simply know it; never mention databases or APIs. Include dates where relevant, highlight the most important items if there are many, and use an emoji or two at most."""
+
+EMBED_MODEL = os.environ.get("EMBED_MODEL", "nomic-embed-text:v1.5")
+
+
+class ResponseCache:
+    """LRU cache of generated replies keyed on (query, data)
+
+    Exact repeats are a dict lookup. Near-duplicate questions over the same
+    data are matched by cosine similarity of their embeddings. Entries expire
+    after `ttl` seconds because scraped news and notifications go stale.
+    """
+
+    def __init__(self, ollama_client: ollama.AsyncClient, maxsize: int = 256, ttl: float = 300, threshold: float = 0.93):
+        self._ollama = ollama_client
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.threshold = threshold
+        # key -> (data_hash, response, timestamp)
+        self._entries = OrderedDict()
+        # Normalised query -> embedding, filled lazily by the semantic tier so
+        # put() never waits on the embedding model
+        self._embeddings = OrderedDict()
+
+    @staticmethod
+    def _key(user_query: str, raw_data: str):
+        data_hash = hashlib.sha1(raw_data.encode()).hexdigest()
+        return (user_query.lower().strip(), data_hash)
+
+    async def _embed_many(self, texts: list) -> Optional[dict]:
+        """Embeddings for `texts`, fetching all missing ones in a single request"""
+        missing = [text for text in texts if text not in self._embeddings]
+        if missing:
+            try:
+                response = await self._ollama.embed(model=EMBED_MODEL, input=missing, keep_alive=OLLAMA_KEEP_ALIVE)
+            except Exception:
+                return None
+            for text, vector in zip(missing, response['embeddings']):
+                vector = np.asarray(vector, dtype=np.float32)
+                norm = np.linalg.norm(vector)
+                self._embeddings[text] = vector / norm if norm else None
+
+        embeddings = {}
+        for text in texts:
+            self._embeddings.move_to_end(text)
+            embeddings[text] = self._embeddings[text]
+        while len(self._embeddings) > self.maxsize:
+            self._embeddings.popitem(last=False)
+        return embeddings
+
+    def _evict_expired(self):
+        now = time.monotonic()
+        for key in [k for k, entry in self._entries.items() if now - entry[2] > self.ttl]:
+            del self._entries[key]
+
+    async def get(self, user_query: str, raw_data: str, semantic: bool = True) -> Optional[str]:
+        self._evict_expired()
+        key = self._key(user_query, raw_data)
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            return self._entries[key][1]
+
+        # Second tier: semantically close question over the same data
+        if not semantic:
+            return None
+        candidates = [k for k, e in self._entries.items() if e[0] == key[1]]
+        if not candidates:
+            return None
+        embeddings = await self._embed_many([key[0], *(k[0] for k in candidates)])
+        if embeddings is None or embeddings[key[0]] is None:
+            return None
+        query_embedding = embeddings[key[0]]
+        scored = [(float(embeddings[k[0]] @ query_embedding), k) for k in candidates if embeddings[k[0]] is not None]
+        if not scored:
+            return None
+        best_score, best_key = max(scored)
+        if best_score >= self.threshold:
+            self._entries.move_to_end(best_key)
+            return self._entries[best_key][1]
+        return None
+
+    def put(self, user_query: str, raw_data: str, response: str):
+        key = self._key(user_query, raw_data)
+        self._entries[key] = (key[1], response, time.monotonic())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+
+class ModelRunner:
+    """Micro-batches concurrent Ollama requests
+
+    Requests arriving within `window` seconds of the first one are dispatched
+    together, so Ollama's continuous batching can decode them in parallel
+    instead of serving them one after another.
+    """
+
+    def __init__(self, ollama_client: ollama.AsyncClient, window: float = 0.05, max_batch: int = 8):
+        self.window = window
+        self.max_batch = max_batch
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._in_flight = set()
+        self._client = ollama_client
+
+    async def submit(self, method: str, **request):
+        """Queue an AsyncClient call (e.g. "chat", "generate") and await its result"""
+        if self._worker is None:
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._run())
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((method, request, future))
+        return await future
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.window
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            # Dispatch in the background so the next window can start filling
+            task = asyncio.create_task(self._dispatch(batch))
+            self._in_flight.add(task)
+            task.add_done_callback(self._in_flight.discard)
+
+    async def _dispatch(self, batch):
+        try:
+            results = await asyncio.gather(
+                *(getattr(self._client, method)(**request) for method, request, _ in batch),
+                return_exceptions=True
+            )
+        except asyncio.CancelledError:
+            # Runner closed mid-request: release everyone waiting on this batch
+            for _, _, future in batch:
+                future.cancel()
+            raise
+        for (_, _, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    async def close(self):
+        """Stop the worker and cancel every pending request so no submit() hangs"""
+        if self._worker:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+
+        in_flight = list(self._in_flight)
+        for task in in_flight:
+            task.cancel()
+        await asyncio.gather(*in_flight, return_exceptions=True)
+
+        if self._queue:
+            while not self._queue.empty():
+                _, _, future = self._queue.get_nowait()
+                future.cancel()
+            self._queue = None
+
+
 class MCPClient:
+    # Keyword routes, compiled once and checked in priority order before
+    # falling back to the LLM tool selector
+    _greet_re = re.compile(
+        r"^\s*(hi+|hello+|hey+|hola|yo|thanks|thank you|good (morning|afternoon|evening)"
+        r"|how are you|what'?s up|sup)\b[\s!.?]*$",
+        re.IGNORECASE,
+    )
+    _notif_re = re.compile(
+        r"\b(notifications?|notices?|circulars?|announcements?|deadlines?)\b",
+        re.IGNORECASE,
+    )
+    # Explicit document keywords win over the broader news words
+    _kb_keyword_re = re.compile(
+        r"\b(syllabus|search|find)\b",
+        re.IGNORECASE,
+    )
+    _news_re = re.compile(
+        # "new" only in "what's new"-style questions; bare it matches too much
+        r"\b(news|events?|fests?|festivals?|workshops?|happening)\b"
+        r"|\b(what'?s|what is|anything) new\b",
+        re.IGNORECASE,
+    )
+    _kb_re = re.compile(
+        # Second-person questions ("who are you") are chat, not lookups
+        r"^\s*(what|who|where)\s+(is|are|was|were)\s+(?!(you|your|yours)\b)",
+        re.IGNORECASE,
+    )
+
+    # Words that carry no topic beyond picking the tool; a question made only
+    # of these ("any new circulars?") gets the newest items, not a re-rank
+    _filler_words = frozenset("""
+        a an the any are is was were what what's whats which show me tell give list
+        get all some there do does did have has new latest recent upcoming current
+        today this week month year please about on for of in at to from college bmsce
+        important anything coming up going
+        news event events fest fests festival festivals workshop workshops happening
+        notification notifications notice notices circular circulars announcement
+        announcements deadline deadlines
+    """.split())
+
     def __init__(self):
         self.session: Optional[ClientSession] = None
         self.available_tools = []
         self.client_context = None
         self.session_context = None
+        # One shared async client: pooled keep-alive HTTP connections to the
+        # Ollama daemon, and no blocking calls inside the event loop
+        self._ollama = ollama.AsyncClient()
+        self.response_cache = ResponseCache(self._ollama)
+        self.runner = ModelRunner(self._ollama)
+        self._keepalive_task: Optional[asyncio.Task] = None
 
     async def connect_to_server(self, server_script_path: str):
         """Connect to the MCP server"""
@@ -44,6 +309,51 @@ class MCPClient:
         result = await self.session.call_tool(tool_name, tool_args)
         return result.content[0].text
 
+    async def _rank_by_relevance(self, query: str, texts: list) -> Optional[list]:
+        """Indices of `texts` ordered by cosine similarity to `query`, or None if embedding fails"""
+        try:
+            response = await self._ollama.embed(model=EMBED_MODEL, input=[query, *texts], keep_alive=OLLAMA_KEEP_ALIVE)
+        except Exception:
+            return None
+        vectors = np.asarray(response['embeddings'], dtype=np.float32)
+        vectors /= np.maximum(np.linalg.norm(vectors, axis=1, keepdims=True), 1e-12)
+        scores = vectors[1:] @ vectors[0]
+        return np.argsort(-scores).tolist()
+
+    async def _trim_tool_output(self, user_query: str, tool_name: str, tool_args: dict, raw_data: str, top_n: int = 5) -> str:
+        """Cut tool output down to what the LLM needs before it is pasted into the prompt"""
+        try:
+            items = orjson.loads(raw_data)
+        except orjson.JSONDecodeError:
+            return raw_data
+        if not isinstance(items, list) or not items:
+            return raw_data
+
+        if tool_name == 'query_knowledge_base':
+            # Chroma already ranked the chunks against query_text with the same
+            # embedding model; re-rank only when the LLM rewrote the query
+            if tool_args.get('query_text') == user_query:
+                return raw_data
+            # Keep every chunk, but put the most relevant first
+            order = await self._rank_by_relevance(user_query, [str(item) for item in items])
+            if order is None:
+                return raw_data
+            return orjson.dumps([items[i] for i in order]).decode()
+
+        if len(items) <= top_n:
+            return orjson.dumps(items).decode()
+
+        # Scraped lists are newest first, so generic questions keep the first N.
+        # That also keeps the trimmed data, and so its cache key, stable
+        # across rewordings of the same question.
+        topic_words = set(re.findall(r"[a-z0-9']+", user_query.lower())) - self._filler_words
+        if not topic_words:
+            return orjson.dumps(items[:top_n]).decode()
+
+        order = await self._rank_by_relevance(user_query, [orjson.dumps(item).decode() for item in items])
+        keep = sorted(order[:top_n]) if order is not None else range(top_n)
+        return orjson.dumps([items[i] for i in keep]).decode()
+
     def get_tools_for_llm(self) -> str:
         """Convert MCP tools to natural language description"""
         tools_desc = []
@@ -55,83 +365,72 @@ class MCPClient:
     async def make_natural_response(self, user_query: str, raw_data: str) -> str:
         """Convert raw JSON data into natural, student-friendly response"""
 
-        prompt = f"""You are a friendly and helpful AI assistant for BMS College of Engineering students. Your name is BMSCE Assistant and you're here to help students with information about college events, notifications, and academic content.
-
-PERSONALITY:
-- Be warm, friendly, and approachable like a helpful senior student
-- Use casual but respectful language
-- Show enthusiasm about college events and achievements
-- Be encouraging and supportive
-- Keep responses concise but informative
-- Use emojis occasionally to be more engaging (but don't overdo it)
-
-TASK:
-A student asked: "{user_query}"
-
-You retrieved this data:
-{raw_data}
-
-Now, present this information in a natural, conversational way. DO NOT mention that you got this from a database or API. Just present it as if you naturally know this information.
-
-FORMATTING GUIDELINES:
-- Use clear numbering (1., 2., 3.) for lists
-- Include relevant dates naturally in the text
-- Group related information together
-- If there are many items, you can summarize or highlight the most important ones
-- End with a friendly closing line if appropriate
-
-Remember: Be natural, be friendly, be helpful! Act like a knowledgeable student helping another student.
-
-Your response:"""
-
-        response = ollama.generate(
-            model='mistral:7b',
-            prompt=prompt,
+        cached = await self.response_cache.get(user_query, raw_data)
+        if cached is not None:
+            return cached
+
+        # Only the question and data vary; the persona stays in the system
+        # message so Ollama can reuse its KV cache across calls
+        prompt = f"Q: {user_query}\nDATA: {raw_data}\nRewrite data as a friendly answer."
+
+        response = await self.runner.submit(
+            "chat",
+            model=CHAT_MODEL,
+            messages=[
+                {"role": "system", "content": PERSONA_SYSTEM_PROMPT},
+                {"role": "user", "content": prompt},
+            ],
             options={
                 "temperature": 0.8,
                 "top_p": 0.9,
-            }
+            },
+            keep_alive=OLLAMA_KEEP_ALIVE
         )
 
-        return response['response'].strip()
-
-    async def chat_with_mistral(self, user_message: str):
-        """Chat with Mistral using MCP tools"""
-
-        # Corrected prompt with explicit formats for each tool
-        decision_prompt = f"""You are a precise tool selector. Your task is to analyze the user's question and choose the most appropriate tool from the list below.
-
-# Available Tools & Formats:
-1.  **get_latest_news**: Use for general inquiries about news, events, festivals, workshops, or what's happening.
-    - Format: {{"tool": "get_latest_news", "arguments": {{}}}}
-
-2.  **get_college_notifications**: Use for official notices, circulars, announcements, and deadlines.
-    - Format: {{"tool": "get_college_notifications", "arguments": {{}}}}
-
-3.  **query_knowledge_base**: Use to search for specific information like syllabus, student details, or specific people.
-    - Format: {{"tool": "query_knowledge_base", "arguments": {{"query_text": "the user's search query"}}}}
-
-4.  **none**: Use for greetings, thank yous, or conversational chat.
-    - Format: {{"tool": "none"}}
-
-# User Question:
-"{user_message}"
-
-# Instructions:
--   Analyze the user's question carefully.
--   Choose the single best tool that matches the user's intent.
--   **Respond with ONLY the JSON object in the exact format specified for the chosen tool.**
+        natural_response = response['message']['content'].strip()
+        self.response_cache.put(user_query, raw_data, natural_response)
+        return natural_response
+
+    def _route_tool(self, user_message: str) -> Optional[dict]:
+        """Pick a tool from keywords alone, or None if the message is ambiguous"""
+        if self._greet_re.search(user_message):
+            return {"tool": "none"}
+        if self._notif_re.search(user_message):
+            return {"tool": "get_college_notifications", "arguments": {}}
+        if self._kb_keyword_re.search(user_message):
+            return {"tool": "query_knowledge_base", "arguments": {"query_text": user_message}}
+        if self._news_re.search(user_message):
+            return {"tool": "get_latest_news", "arguments": {}}
+        if self._kb_re.search(user_message):
+            return {"tool": "query_knowledge_base", "arguments": {"query_text": user_message}}
+        return None
 
-Your JSON response:"""
+    async def _select_tool_with_llm(self, user_message: str) -> Optional[dict]:
+        """Ask Mistral to choose a tool when keyword routing is inconclusive"""
 
         # Get tool decision with lower temperature for consistency
-        decision_response = ollama.generate(
-            model='mistral:7b',
-            prompt=decision_prompt,
-            options={"temperature": 0.1, "top_p": 0.5}
+        decision_response = await self.runner.submit(
+            "chat",
+            model=ROUTER_MODEL,
+            messages=[
+                {"role": "system", "content": DECISION_SYSTEM_PROMPT},
+                {"role": "user", "content": f'# User Question:\n"{user_message}"\n\nYour JSON response:'},
+            ],
+            # Grammar-constrained decoding: the reply is always a JSON object
+            format="json",
+            options={"temperature": 0.1, "top_p": 0.5},
+            keep_alive=OLLAMA_KEEP_ALIVE
         )
 
-        tool_call = self._extract_tool_call(decision_response['response'])
+        return self._extract_tool_call(decision_response['message']['content'])
+
+    async def chat_with_mistral(self, user_message: str):
+        """Chat with Mistral using MCP tools"""
+
+        # Cheap keyword routing first; only ask the LLM when nothing matches
+        tool_call = self._route_tool(user_message)
+        if tool_call is None:
+            tool_call = await self._select_tool_with_llm(user_message)
 
         if tool_call and tool_call.get('tool') != 'none':
             tool_name = tool_call['tool']
@@ -140,6 +439,7 @@ Your JSON response:"""
             try:
                 # Execute tool
                 raw_data = await self.process_tool_call(tool_name, tool_args)
+                raw_data = await self._trim_tool_output(user_message, tool_name, tool_args, raw_data)
 
                 # Convert to natural response
                 natural_response = await self.make_natural_response(user_message, raw_data)
@@ -150,7 +450,14 @@ Your JSON response:"""
                 print(f"DEBUG: An error occurred while calling the tool: {e}")
                 print(f"Oops! I had trouble getting that information. Could you try asking in a different way? 😊\n")
         else:
-            # General conversation without tools
+            # General conversation without tools. Exact matches only: with no
+            # data to anchor it, "tell me a joke" and "tell me another joke"
+            # would look like the same question to the semantic tier
+            cached = await self.response_cache.get(user_message, "", semantic=False)
+            if cached is not None:
+                print(f"{cached}\n")
+                return
+
             chat_prompt = f"""You are a friendly AI assistant for BMS College of Engineering students.
 
 User: {user_message}
@@ -159,37 +466,107 @@ Respond in a warm, helpful, and student-friendly way. Keep it concise and natura
 
 Your response:"""
 
-            response = ollama.generate(
-                model='mistral:7b',
+            response = await self.runner.submit(
+                "generate",
+                model=CHAT_MODEL,
                 prompt=chat_prompt,
-                options={"temperature": 0.8}
+                options={"temperature": 0.8},
+                keep_alive=OLLAMA_KEEP_ALIVE
             )
 
-            print(f"{response['response'].strip()}\n")
+            reply = response['response'].strip()
+            self.response_cache.put(user_message, "", reply)
+            print(f"{reply}\n")
 
     def _extract_tool_call(self, text: str) -> Optional[dict]:
         """Extract tool call from LLM response"""
-        try:
-            # Remove markdown code blocks if present
-            text = text.replace('```json', '').replace('```', '').strip()
-
-            # Look for JSON object
-            start = text.find('{')
-            end = text.rfind('}') + 1
-            if start != -1 and end > start:
-                json_str = text[start:end]
-                tool_call = json.loads(json_str)
-                return tool_call
-        except:
-            pass
+        # Find the first '{' and its matching '}' in one scan, skipping braces
+        # inside strings, so markdown fences never need stripping
+        start = text.find('{')
+        if start == -1:
+            return None
+
+        depth = 0
+        in_string = False
+        escaped = False
+        for i in range(start, len(text)):
+            char = text[i]
+            if in_string:
+                if escaped:
+                    escaped = False
+                elif char == '\\':
+                    escaped = True
+                elif char == '"':
+                    in_string = False
+            elif char == '"':
+                in_string = True
+            elif char == '{':
+                depth += 1
+            elif char == '}':
+                depth -= 1
+                if depth == 0:
+                    try:
+                        tool_call = orjson.loads(text[start:i + 1])
+                    except orjson.JSONDecodeError:
+                        return None
+                    return tool_call if isinstance(tool_call, dict) else None
         return None
 
+    async def _keepalive_ping(self):
+        """Keep Mistral resident in Ollama while the user is idle"""
+        models = dict.fromkeys([CHAT_MODEL, ROUTER_MODEL])
+        while True:
+            for model in models:
+                try:
+                    # An empty prompt only loads the model and refreshes keep_alive
+                    await self._ollama.generate(model=model, prompt='', keep_alive=OLLAMA_KEEP_ALIVE)
+                except Exception:
+                    pass
+            await asyncio.sleep(KEEPALIVE_INTERVAL)
+
+    def start_keepalive(self):
+        """Start the background keep-alive ping if it isn't running"""
+        if self._keepalive_task is None:
+            self._keepalive_task = asyncio.create_task(self._keepalive_ping())
+
     async def close(self):
         """Close the connection"""
-        if hasattr(self, 'session_context') and self.session_context:
-            await self.session_context.__aexit__(None, None, None)
-        if hasattr(self, 'client_context') and self.client_context:
-            await self.client_context.__aexit__(None, None, None)
+        if self._keepalive_task:
+            self._keepalive_task.cancel()
+            self._keepalive_task = None
+        await self.runner.close()
+
+        # Detach first so a second close() is a no-op. The contexts are exited
+        # in order, not concurrently: the session is nested inside the stdio
+        # transport and both hold anyio cancel scopes bound to this task.
+        session_context, self.session_context = self.session_context, None
+        client_context, self.client_context = self.client_context, None
+        self.session = None
+        if session_context:
+            await session_context.__aexit__(None, None, None)
+        if client_context:
+            await client_context.__aexit__(None, None, None)
+
+
+async def ainput(prompt: str) -> str:
+    """input() on a daemon thread so the event loop keeps running while the user types"""
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def deliver(setter, value):
+        if not future.done():
+            setter(value)
+
+    def read():
+        try:
+            line = input(prompt)
+        except Exception as e:
+            loop.call_soon_threadsafe(deliver, future.set_exception, e)
+        else:
+            loop.call_soon_threadsafe(deliver, future.set_result, line)
+
+    threading.Thread(target=read, daemon=True).start()
+    return await future
 
 
 async def main():
@@ -207,9 +584,12 @@ async def main():
     print("   Type 'quit' or 'exit' when you're done.\n")
     print("─" * 60 + "\n")
 
+    # Warm the model now and keep it loaded while we wait on the user
+    client.start_keepalive()
+
     try:
         while True:
-            user_input = input("You: ").strip()
+            user_input = (await ainput("You: ")).strip()
 
             if user_input.lower() in ['quit', 'exit', 'bye', 'goodbye']:
                 print("\n👋 See you later! Have an awesome day! 🌟\n")
@@ -222,11 +602,15 @@ async def main():
             await client.chat_with_mistral(user_input)
             print("─" * 60 + "\n")
 
-    except KeyboardInterrupt:
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        # asyncio.run turns Ctrl+C into a cancellation of main()
         print("\n\n👋 Catch you later! Take care! 🌟\n")
     finally:
         await client.close()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
\ No newline at end of file
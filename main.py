@@ -1,18 +1,62 @@
-import json
+import sys
+import threading
+import orjson
+from cachetools import TTLCache
 from fastmcp import FastMCP
 from web_scrap import get_news_events,get_notifications
 
-from vector_db import collection
+from vector_db import get_collection
 
 mcp = FastMCP("MCP for BMS College of Engineering")
 
+# Scraped pages cached for 5 minutes; refreshed in the background just
+# before they expire so tool calls never wait on the website
+SCRAPE_TTL = 300
+_scrape_cache = TTLCache(maxsize=4, ttl=SCRAPE_TTL)
+_scrape_lock = threading.Lock()
+_scrapers = {
+    "news": get_news_events,
+    "notifications": get_notifications,
+}
+
+
+def _scrape(key: str, refresh: bool = False) -> str:
+    """
+    Returns the cached scrape for `key`, scraping on a miss or when `refresh` is set.
+    Error payloads are not cached.
+    """
+    if not refresh:
+        with _scrape_lock:
+            cached = _scrape_cache.get(key)
+        if cached is not None:
+            return cached
+
+    value = _scrapers[key]()
+    if '"error"' not in value:
+        with _scrape_lock:
+            _scrape_cache[key] = value
+    return value
+
+
+def _refresh_scrapes(stop: threading.Event):
+    while True:
+        for key in _scrapers:
+            try:
+                _scrape(key, refresh=True)
+            except Exception:
+                # Leave the entry to expire; the next tool call scrapes again
+                pass
+        if stop.wait(SCRAPE_TTL - 30):
+            return
+
+
 @mcp.tool()
 def get_latest_news():
     """
     Extracts the 'News & Events' Website,
     and returns the data as a JSON string.
     """ 
-    return get_news_events()
+    return _scrape("news")
 
 
 @mcp.tool()
@@ -21,7 +65,7 @@ def get_college_notifications():
     Extracts 'College Notifications' from the Website,
     and returns the data as a JSON string.
     """
-    return get_notifications()
+    return _scrape("notifications")
 
 
 @mcp.tool()
@@ -29,18 +73,24 @@ def query_knowledge_base(query_text: str, n_results: int = 3) -> str:
     """
     Queries the ChromaDB vector store to find the most relevant document chunks for a given text query.
     """
+    try:
+        collection = get_collection()
+    except Exception as e:
+        return orjson.dumps({"error": f"Cannot query. ChromaDB collection is not available: {e}"}).decode()
     if not collection:
-        return json.dumps({"error": "Cannot query. ChromaDB collection is not available."})
+        return orjson.dumps({"error": "Cannot query. ChromaDB collection is not available."}).decode()
     
     try:
         results = collection.query(
             query_texts=[query_text],
-            n_results=n_results
+            n_results=n_results,
+            include=["documents"]
         )
         # CRITICAL CHANGE: Return the actual documents found, formatted as JSON.
-        return json.dumps(results['documents'][0], indent=2)
+        # Compact on purpose: the consumer is an LLM, indentation only adds prompt tokens
+        return orjson.dumps(results['documents'][0]).decode()
     except Exception as e:
-        return json.dumps({"error": f"An error occurred during the query: {e}"})
+        return orjson.dumps({"error": f"An error occurred during the query: {e}"}).decode()
 
     
 
@@ -51,4 +101,15 @@ def query_knowledge_base(query_text: str, n_results: int = 3) -> str:
 
 
 if __name__ == "__main__":
-    mcp.run()
\ No newline at end of file
+    stop_refresh = threading.Event()
+    threading.Thread(target=_refresh_scrapes, args=(stop_refresh,), daemon=True).start()
+    # Open ChromaDB now so the first knowledge-base query doesn't pay for it
+    # (stderr only: stdout carries the MCP stdio protocol)
+    try:
+        get_collection()
+    except Exception as e:
+        print(f"⚠️ ChromaDB collection could not be opened: {e}", file=sys.stderr)
+    try:
+        mcp.run()
+    finally:
+        stop_refresh.set()
\ No newline at end of file
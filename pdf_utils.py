@@ -0,0 +1,36 @@
+import pymupdf
+import xxhash
+
+# Pure PDF -> chunk helpers. Kept free of import-time side effects so
+# ingestion worker processes can import them without opening ChromaDB.
+
+# -----------------------------
+# PDF Text Extraction
+# -----------------------------
+def extract_text_from_pdf(pdf_path: str) -> str:
+    # MuPDF does the extraction in C, much faster than pure-Python PyPDF2
+    with pymupdf.open(pdf_path) as doc:
+        return "\n".join(page.get_text("text") for page in doc)
+
+# -----------------------------
+# Split text into chunks
+# -----------------------------
+def split_text(text: str, chunk_size: int = 1000, overlap: int = 100) -> list:
+    # Chunk starts are known up front, so build every chunk in one pass
+    step = chunk_size - overlap
+    return [
+        chunk
+        for start in range(0, len(text), step)
+        if (chunk := text[start:start + chunk_size].strip())
+    ]
+
+# -----------------------------
+# Extract + chunk one PDF
+# -----------------------------
+def extract_and_chunk(pdf_path: str) -> tuple:
+    # CPU-bound half of ingestion; top-level so worker processes can run it
+    chunks = split_text(extract_text_from_pdf(pdf_path))
+
+    # Content hashes as IDs, so identical chunks dedupe across files and re-runs
+    ids = [xxhash.xxh64(chunk).hexdigest() for chunk in chunks]
+    return ids, chunks
@@ -1,74 +1,108 @@
 import os
 import chromadb
+import ollama
+from concurrent.futures import ProcessPoolExecutor
 from chromadb.utils import embedding_functions
-from PyPDF2 import PdfReader
+
+from pdf_utils import extract_and_chunk
 
 # -----------------------------
-# PDF Text Extraction
+# Persistent ChromaDB Setup
 # -----------------------------
-def extract_text_from_pdf(pdf_path: str) -> str:
-    reader = PdfReader(pdf_path)
-    text = ""
-    for page in reader.pages:
-        text += page.extract_text() or ""  # handle None pages
-    return text
+PERSIST_DIR = "chroma_storage"
+
+# Set EMBED_MODEL to a quantized tag (e.g. a q8_0 build of nomic-embed-text)
+# to halve embedding memory bandwidth; re-ingest after switching models
+EMBED_MODEL = os.environ.get("EMBED_MODEL", "nomic-embed-text:v1.5")
+
+_collection = None
+
+
+def get_collection():
+    # Opened on first use rather than at import, so processes that only
+    # import this module (e.g. spawned ingestion workers) never touch the DB
+    global _collection
+    if _collection is None:
+        os.makedirs(PERSIST_DIR, exist_ok=True)
+
+        # Telemetry off: avoids a background HTTP call every session
+        client = chromadb.PersistentClient(
+            path=PERSIST_DIR,
+            settings=chromadb.Settings(anonymized_telemetry=False)
+        )
+
+        # Create or load collection
+        # HNSW params only apply when the collection is first created; delete
+        # PERSIST_DIR and re-ingest to pick up changes
+        _collection = client.get_or_create_collection(
+            name="docs",
+            embedding_function=embedding_functions.OllamaEmbeddingFunction(model_name=EMBED_MODEL),
+            metadata={
+                "hnsw:space": "cosine",
+                "hnsw:M": 32,
+                "hnsw:construction_ef": 200,
+                "hnsw:search_ef": 50,
+                "hnsw:batch_size": 100,
+            }
+        )
+    return _collection
 
 # -----------------------------
-# Split text into chunks
+# Batch Embeddings
 # -----------------------------
-def split_text(text: str, chunk_size: int = 1000, overlap: int = 100) -> list:
-    chunks = []
-    start = 0
-    while start < len(text):
-        end = min(start + chunk_size, len(text))
-        chunk = text[start:end].strip()
-        if chunk:
-            chunks.append(chunk)
-        start += chunk_size - overlap
-    return chunks
+def embed_chunks(chunks: list) -> list:
+    # One round-trip for the whole list instead of one per chunk, on the
+    # same /api/embed endpoint Chroma's OllamaEmbeddingFunction queries with
+    return ollama.embed(model=EMBED_MODEL, input=chunks)["embeddings"]
 
 # -----------------------------
-# Persistent ChromaDB Setup
+# Add PDFs to VectorDB
 # -----------------------------
-PERSIST_DIR = "chroma_storage"
-os.makedirs(PERSIST_DIR, exist_ok=True)
+def add_pdfs_to_vectordb(pdf_paths: list):
+    # Extract and split every PDF in parallel
+    if len(pdf_paths) > 1:
+        with ProcessPoolExecutor(max_workers=min(len(pdf_paths), os.cpu_count() or 1)) as executor:
+            results = list(executor.map(extract_and_chunk, pdf_paths))
+    else:
+        results = [extract_and_chunk(pdf_path) for pdf_path in pdf_paths]
 
-client = chromadb.PersistentClient(path=PERSIST_DIR)
+    # id -> chunk; drops repeats within this batch
+    new_chunks = {}
+    for pdf_path, (ids, chunks) in zip(pdf_paths, results):
+        if not chunks:
+            print(f"⚠️ No text found in {pdf_path}, skipping.")
+            continue
+        new_chunks.update(zip(ids, chunks))
+        print(f"📄 Split {pdf_path} into {len(chunks)} chunks.")
 
-# Embedding function
-ollama_ef = embedding_functions.OllamaEmbeddingFunction(model_name="nomic-embed-text:v1.5")
+    if not new_chunks:
+        return
 
-# Create or load collection
-collection = client.get_or_create_collection(
-    name="docs",
-    embedding_function=ollama_ef
-)
+    collection = get_collection()
 
-# -----------------------------
-# Add PDF to VectorDB
-# -----------------------------
-def add_pdf_to_vectordb(pdf_path: str):
-    # Extract text
-    pdf_text = extract_text_from_pdf(pdf_path)
-    
-    # Split into chunks
-    chunks = split_text(pdf_text)
-    
-    # Generate unique IDs to avoid collisions
-    base_name = os.path.splitext(os.path.basename(pdf_path))[0]
-    ids = [f"{base_name}_chunk_{i}" for i in range(len(chunks))]
-    
-    # Add to collection
+    # Skip chunks already in the collection before paying for their embeddings
+    existing = set(collection.get(ids=list(new_chunks), include=[])["ids"])
+    all_ids = [chunk_id for chunk_id in new_chunks if chunk_id not in existing]
+    all_chunks = [new_chunks[chunk_id] for chunk_id in all_ids]
+    if not all_chunks:
+        print("✅ All chunks already in collection, nothing to add.")
+        return
+
+    # One embedding request and one insert for all files
     collection.add(
-        documents=chunks,
-        ids=ids
+        documents=all_chunks,
+        ids=all_ids,
+        embeddings=embed_chunks(all_chunks)
     )
-    print(f"✅ Added {len(chunks)} chunks from {pdf_path} to collection.")
+    print(f"✅ Added {len(all_chunks)} chunks from {len(pdf_paths)} PDF(s) to collection.")
+
+
+def add_pdf_to_vectordb(pdf_path: str):
+    add_pdfs_to_vectordb([pdf_path])
 
 # -----------------------------
 # Example Usage
 # -----------------------------
 if __name__ == "__main__":
     pdf_files = ["Kedar_Jevargi_Resume.pdf"]
-    for pdf in pdf_files:
-        add_pdf_to_vectordb(pdf)
+    add_pdfs_to_vectordb(pdf_files)